@@ -2,13 +2,18 @@
 
 import argparse
 import logging
-import shutil
+import os
+import queue
 import sys
+import threading
 import time
 from pathlib import Path
 
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
 from config import validate_config
-from paper_processor import setup_logging, process_single_paper
+from paper_processor import setup_logging, process_single_paper, _move_pdf, _run_batch, _walk_pdfs
 
 logger = logging.getLogger(__name__)
 
@@ -25,52 +30,33 @@ def _processed_dir(folder: Path) -> Path:
 # ---------------------------------------------------------------------------
 
 
-def batch(folder_path: str, source: str, recursive: bool = False) -> dict[str, int]:
+def batch(folder_path: str, source: str, recursive: bool = False, workers: int = 4) -> dict[str, int]:
     """Process all PDFs once, moving successes into processed/.
 
     Args:
         folder_path: Directory to search.
         source: Source label for papers.
         recursive: If True, search subdirectories recursively.
+        workers: Number of papers processed concurrently.
     """
     folder = Path(folder_path)
     if not folder.is_dir():
         print(f"ERROR — not a directory: {folder_path}")
         sys.exit(1)
 
-    proc_dir = _processed_dir(folder)
-    pdfs = sorted(folder.rglob("*.pdf") if recursive else folder.glob("*.pdf"))
-    counts = {"success": 0, "failed": 0}
-
-    if not pdfs:
+    search_desc = "(including subdirectories)" if recursive else ""
+    print(f"\nProcessing PDFs from {folder_path} {search_desc}\n".strip())
+
+    counts = _run_batch(
+        _walk_pdfs(folder, recursive),
+        source,
+        move_to=_processed_dir(folder),
+        workers=workers,
+        root=folder,
+    )
+    if not counts:
         search_desc = "recursively" if recursive else ""
         print(f"No PDFs found in {folder_path} {search_desc}".strip())
-        return counts
-
-    search_desc = "(including subdirectories)" if recursive else ""
-    print(f"\nProcessing {len(pdfs)} PDF(s) from {folder_path} {search_desc}\n".strip())
-
-    for i, pdf in enumerate(pdfs, 1):
-        # Show relative path for recursive searches
-        display_path = str(pdf.relative_to(folder)) if recursive else pdf.name
-        print(f"\n[{i}/{len(pdfs)}] {display_path}")
-        if process_single_paper(str(pdf), source):
-            counts["success"] += 1
-            # Preserve relative structure in processed/ folder when recursive
-            if recursive:
-                rel_path = pdf.relative_to(folder)
-                dest = proc_dir / rel_path
-                dest.parent.mkdir(parents=True, exist_ok=True)
-            else:
-                dest = proc_dir / pdf.name
-            shutil.move(str(pdf), str(dest))
-            print(f"  → Moved to processed/{dest.relative_to(proc_dir)}")
-        else:
-            counts["failed"] += 1
-        if i < len(pdfs):
-            time.sleep(2)  # Gemini rate-limit courtesy
-
-    print(f"\nDone — {counts['success']} ok, {counts['failed']} failed")
     return counts
 
 
@@ -79,14 +65,179 @@ def batch(folder_path: str, source: str, recursive: bool = False) -> dict[str, i
 # ---------------------------------------------------------------------------
 
 
-def watch(folder_path: str, source: str, interval: int = 10, recursive: bool = False) -> None:
-    """Poll *folder_path* for new PDFs every *interval* seconds.
+# A new file must go this long without changing size or mtime before it is
+# treated as fully written.  If it still lacks a PDF trailer after
+# _WRITE_TIMEOUT seconds it is processed anyway (and retried if that fails).
+_SETTLE_SECONDS = 2.0
+_WRITE_TIMEOUT = 60.0
+
+
+def _has_pdf_trailer(path: Path) -> bool:
+    """True if the file ends with the %%EOF marker every complete PDF has."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(max(f.seek(0, os.SEEK_END) - 1024, 0))
+            return b"%%EOF" in f.read()
+    except OSError:
+        return False
+
+
+def _wait_until_written(path: Path) -> bool:
+    """Block until *path* looks completely written; False if it disappeared.
+
+    Creation events (and polling hits) arrive while a copy is still in
+    progress, and MuPDF happily "repairs" a truncated PDF, so a half-copied
+    file would otherwise be processed with partial text.  A file counts as
+    written once its size and mtime have settled and it ends in a trailer.
+    """
+    deadline = time.monotonic() + _WRITE_TIMEOUT
+    last = None
+    while True:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return False
+        signature = (st.st_size, st.st_mtime_ns)
+        settled = signature == last or time.time() - st.st_mtime > _SETTLE_SECONDS
+        if settled and (_has_pdf_trailer(path) or time.monotonic() > deadline):
+            return True
+        last = signature
+        time.sleep(_SETTLE_SECONDS)
+
+
+class _PdfEventHandler(FileSystemEventHandler):
+    """Queue every PDF created in, written in, or moved into the watched folder.
+
+    Creation is always queued: a file moved in from elsewhere on the same
+    filesystem arrives as a bare creation with no close event.  Where the
+    platform reports it (inotify), the close after writing queues the file
+    again; ``watch`` waits for it to finish writing and skips repeats.
+    """
+
+    def __init__(self, pending: "queue.Queue[Path]") -> None:
+        super().__init__()
+        self._pending = pending
+
+    def on_created(self, event) -> None:
+        if not event.is_directory and event.src_path.lower().endswith(".pdf"):
+            self._pending.put(Path(event.src_path))
+
+    def on_closed(self, event) -> None:
+        if not event.is_directory and event.src_path.lower().endswith(".pdf"):
+            self._pending.put(Path(event.src_path))
+
+    def on_moved(self, event) -> None:
+        if not event.is_directory and event.dest_path.lower().endswith(".pdf"):
+            self._pending.put(Path(event.dest_path))
+
+
+# Directory → (mtime_ns, listed_at_ns, PDFs in it, subdirectories)
+_dir_listing_cache: dict[str, tuple[int, int, list[Path], list[str]]] = {}
+_unreadable_dirs: set[str] = set()  # already warned about, until readable again
+
+# Network filesystems keep mtimes at 1–2 s granularity, so a file created in
+# the same tick as a listing leaves the mtime unchanged.  Like git's "racy"
+# index entries, a listing taken this soon after the mtime is not trusted.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _forget_dir(d: str) -> None:
+    """Drop cached listings for *d* and everything below it."""
+    prefix = d + os.sep
+    for key in [k for k in _dir_listing_cache if k == d or k.startswith(prefix)]:
+        del _dir_listing_cache[key]
+
+
+def _cached_glob(folder: Path, recursive: bool, exclude: Path) -> list[Path]:
+    """List PDFs under *folder*, re-reading only directories whose mtime changed.
+
+    Creating, deleting or renaming an entry bumps its parent directory's
+    mtime, so an unchanged directory costs one stat() rather than one per file.
+    """
+    pdfs: list[Path] = []
+    stack = [str(folder)]
+    while stack:
+        d = stack.pop()
+        try:
+            mtime = os.stat(d).st_mtime_ns
+            cached = _dir_listing_cache.get(d)
+            stale = cached is None or cached[0] != mtime or cached[1] - mtime < _RACY_WINDOW_NS
+            if stale:
+                listed_at = time.time_ns()
+                files: list[Path] = []
+                subdirs: list[str] = []
+                with os.scandir(d) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.path != str(exclude):
+                                subdirs.append(entry.path)
+                        elif entry.name.lower().endswith(".pdf"):
+                            files.append(Path(entry.path))
+        except OSError as exc:
+            # Gone or unreadable: skip it this pass rather than kill the watcher
+            if not isinstance(exc, FileNotFoundError) and d not in _unreadable_dirs:
+                logger.warning("Skipping %s: %s", d, exc)
+                _unreadable_dirs.add(d)
+            _forget_dir(d)
+            continue
+        _unreadable_dirs.discard(d)
+        if stale:
+            if cached is not None:
+                for gone in set(cached[3]) - set(subdirs):
+                    _forget_dir(gone)
+            cached = _dir_listing_cache[d] = (mtime, listed_at, files, subdirs)
+        pdfs.extend(cached[2])
+        if recursive:
+            stack.extend(cached[3])
+    return pdfs
+
+
+class _PollingWatcher(threading.Thread):
+    """Fallback for mounts without filesystem events: rescan every *interval* s."""
+
+    def __init__(self, folder: Path, recursive: bool, interval: int,
+                 pending: "queue.Queue[Path]", exclude: Path) -> None:
+        super().__init__(daemon=True)
+        self._folder = folder
+        self._recursive = recursive
+        self._interval = interval
+        self._pending = pending
+        self._exclude = exclude
+        self._stop_event = threading.Event()
+        self._known = set(_cached_glob(folder, recursive, exclude))
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            current = set(_cached_glob(self._folder, self._recursive, self._exclude))
+            for pdf_path in sorted(current - self._known):
+                self._pending.put(pdf_path)
+            self._known = current
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+def watch(
+    folder_path: str,
+    source: str,
+    interval: int = 10,
+    recursive: bool = False,
+    poll: bool = False,
+) -> None:
+    """Process new PDFs in *folder_path* as soon as they appear.
+
+    Relies on native filesystem events (inotify, FSEvents, …) so an idle
+    watch costs no CPU.  PDFs already present at startup are picked up by a
+    single initial scan.
 
     Args:
         folder_path: Directory to watch.
         source: Source label for papers.
-        interval: Seconds between scans.
+        interval: Seconds to wait before retrying failed PDFs (and the scan
+            period when *poll* is set).
         recursive: If True, watch subdirectories recursively.
+        poll: Fall back to periodic scanning, for network mounts (NFS, SMB)
+            that do not deliver filesystem events.
     """
     folder = Path(folder_path)
     if not folder.is_dir():
@@ -95,29 +246,59 @@ def watch(folder_path: str, source: str, interval: int = 10, recursive: bool = F
 
     proc_dir = _processed_dir(folder)
     # Track by full relative path to handle recursive properly
-    seen: set[str] = {str(p.relative_to(proc_dir)) for p in proc_dir.rglob("*.pdf")}
+    seen: set[str] = {os.path.relpath(p, proc_dir) for p in _walk_pdfs(proc_dir, recursive=True)}
+    pending: "queue.Queue[Path]" = queue.Queue()
+    failed: set[Path] = set()
 
-    search_desc = "(including subdirectories)" if recursive else ""
-    print(f"\nWatching {folder_path} {search_desc} (poll every {interval}s) … Ctrl+C to stop\n".strip())
+    if poll:
+        observer = _PollingWatcher(folder, recursive, interval, pending, exclude=proc_dir)
+    else:
+        observer = Observer()
+        observer.schedule(_PdfEventHandler(pending), str(folder), recursive=recursive)
+    observer.start()
 
-    while True:
-        current_pdfs = folder.rglob("*.pdf") if recursive else folder.glob("*.pdf")
-        current_paths = {str(p.relative_to(folder)): p for p in current_pdfs}
-        new = sorted(set(current_paths.keys()) - seen)
+    # Files that arrived before the observer started produce no events
+    for pdf_path in _walk_pdfs(folder, recursive):
+        pending.put(pdf_path)
+
+    search_desc = "(including subdirectories)" if recursive else ""
+    mode_desc = f"poll every {interval}s" if poll else "filesystem events"
+    print(f"\nWatching {folder_path} {search_desc} ({mode_desc}) … Ctrl+C to stop\n".strip())
+
+    try:
+        while True:
+            try:
+                pdf_path = pending.get(timeout=interval)
+            except queue.Empty:
+                # Quiet period — give earlier failures another chance
+                for pdf_path in failed:
+                    pending.put(pdf_path)
+                failed.clear()
+                continue
+
+            # Skip stale events and our own moves into processed/
+            if not pdf_path.is_file() or proc_dir in pdf_path.parents:
+                continue
+            rel_path_str = str(pdf_path.relative_to(folder))
+            if rel_path_str in seen:
+                continue
+
+            if not _wait_until_written(pdf_path):
+                continue
 
-        for rel_path_str in new:
-            pdf_path = current_paths[rel_path_str]
             print(f"\nNew PDF: {rel_path_str}")
             if process_single_paper(str(pdf_path), source):
                 # Preserve directory structure in processed/
-                dest = proc_dir / rel_path_str
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                shutil.move(str(pdf_path), str(dest))
+                _move_pdf(pdf_path, proc_dir / rel_path_str)
                 seen.add(rel_path_str)
+                failed.discard(pdf_path)
                 print(f"  → Moved to processed/{rel_path_str}")
             else:
-                print(f"  → Failed — will retry on next scan")
-        time.sleep(interval)
+                failed.add(pdf_path)
+                print(f"  → Failed — will retry in {interval}s")
+    finally:
+        observer.stop()
+        observer.join()
 
 
 # ---------------------------------------------------------------------------
@@ -136,7 +317,8 @@ def main() -> None:
             "  python batch_process.py --folder ~/Papers --source \"PI Recommendation\"\n"
             "  python batch_process.py --folder ~/Papers -r --source \"PI Recommendation\"\n"
             "  python batch_process.py --watch ~/Papers --source \"Conference\"\n"
-            "  python batch_process.py --watch ~/Papers -r --source \"Conference\""
+            "  python batch_process.py --watch ~/Papers -r --source \"Conference\"\n"
+            "  python batch_process.py --watch /mnt/nas/Papers --poll --source \"Conference\""
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -144,8 +326,10 @@ def main() -> None:
     group.add_argument("--folder",   metavar="PATH", help="Process all PDFs once and move to processed/.")
     group.add_argument("--watch",    metavar="PATH", help="Watch folder continuously for new PDFs.")
     parser.add_argument("--source",   default="Self-found", help='Source label (default: "Self-found").')
-    parser.add_argument("--interval", type=int, default=10, help="Watch poll interval in seconds (default: 10).")
+    parser.add_argument("--interval", type=int, default=10, help="Watch retry / poll interval in seconds (default: 10).")
+    parser.add_argument("--poll",     action="store_true", help="Watch by polling instead of filesystem events (NFS/SMB mounts).")
     parser.add_argument("-r", "--recursive", action="store_true", help="Search subdirectories recursively.")
+    parser.add_argument("--workers",  type=int, default=4, help="Papers processed in parallel with --folder (default: 4).")
 
     args = parser.parse_args()
 
@@ -157,9 +341,9 @@ def main() -> None:
         sys.exit(1)
 
     if args.folder:
-        batch(args.folder, args.source, recursive=args.recursive)
+        batch(args.folder, args.source, recursive=args.recursive, workers=args.workers)
     else:
-        watch(args.watch, args.source, args.interval, recursive=args.recursive)
+        watch(args.watch, args.source, args.interval, recursive=args.recursive, poll=args.poll)
 
 
 if __name__ == "__main__":
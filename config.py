@@ -26,7 +26,10 @@ GEMINI_MODEL: str = "gemini-2.5-flash"
 MAX_TEXT_LENGTH: int = 30_000  # chars forwarded to Gemini (fits free-tier context)
 REQUEST_RETRY_COUNT: int = 3
 REQUEST_RETRY_DELAY: float = 2.0  # base back-off in seconds
+MAX_PDF_BYTES: int = 100 * 1024 * 1024  # larger downloads are aborted
+GEMINI_MIN_INTERVAL: float = 60 / 15  # min seconds between Gemini calls (free tier: 15/min), shared by all workers
 LOG_FILE: str = str(Path(__file__).resolve().parent / "logs" / "paper_processor.log")
+CACHE_DIR: str = str(Path(__file__).resolve().parent / "cache")
 
 
 def validate_config() -> list[str]:
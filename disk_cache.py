@@ -0,0 +1,66 @@
+"""On-disk JSON cache — lets reruns skip work already done for the same input."""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import tempfile
+from typing import Optional
+
+from config import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file's contents, hashed straight from an mmap of the file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size:  # mmap rejects empty files
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+    return digest.hexdigest()
+
+
+def data_digest(data: bytes) -> str:
+    """SHA-256 of an in-memory PDF; matches ``file_digest`` of the same bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _entry_path(namespace: str, key: str) -> str:
+    return os.path.join(CACHE_DIR, namespace, f"{key}.json")
+
+
+def load(namespace: str, key: str) -> Optional[dict]:
+    """Return the cached value for *key*, or None if missing or unreadable."""
+    path = _entry_path(namespace, key)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as exc:
+        logger.warning("Ignoring unreadable cache entry %s: %s", path, exc)
+        return None
+
+
+def store(namespace: str, key: str, value: dict) -> None:
+    """Write *value* atomically so readers never see a partial entry.
+
+    Failures are non-fatal — the cache is an optimisation, not a record.
+    """
+    directory = os.path.join(CACHE_DIR, namespace)
+    tmp_path: Optional[str] = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=directory, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp_path = tmp.name
+            json.dump(value, tmp, ensure_ascii=False)
+        os.replace(tmp_path, _entry_path(namespace, key))
+    except OSError as exc:
+        logger.warning("Could not write cache entry %s/%s: %s", namespace, key, exc)
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
@@ -1,17 +1,35 @@
 """Gemini-powered paper analysis — extracts structured metadata from text."""
 
+import asyncio
+import hashlib
 import json
 import logging
-import re
+import threading
 import time
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import google.generativeai as genai
+from config import (
+    GEMINI_API_KEY,
+    GEMINI_MIN_INTERVAL,
+    GEMINI_MODEL,
+    MAX_TEXT_LENGTH,
+    REQUEST_RETRY_COUNT,
+    REQUEST_RETRY_DELAY,
+)
 
-from config import GEMINI_API_KEY, GEMINI_MODEL, MAX_TEXT_LENGTH, REQUEST_RETRY_COUNT, REQUEST_RETRY_DELAY
+if TYPE_CHECKING:
+    import google.generativeai as genai
 
 logger = logging.getLogger(__name__)
 
+# Rate limiting is shared by every thread that calls analyze_paper
+_rate_lock = threading.Lock()
+_last_call: float = 0.0
+
+# One configured model handle (and its gRPC channel) for the whole process
+_MODEL_LOCK = threading.Lock()
+_MODEL: Optional["genai.GenerativeModel"] = None
+
 # ---------------------------------------------------------------------------
 # Prompt
 # ---------------------------------------------------------------------------
@@ -47,6 +65,11 @@ Paper text (may be truncated for long papers):
 
 {paper_text}"""
 
+# disk_cache namespace for analyses: they are only valid for the model, prompt
+# and truncation length that produced them, so changing any starts afresh
+_PROMPT_HASH = hashlib.sha256(f"{MAX_TEXT_LENGTH}\n{_PROMPT_TEMPLATE}".encode()).hexdigest()
+ANALYSIS_CACHE_NAMESPACE = f"analysis/{GEMINI_MODEL.replace('/', '_')}-{_PROMPT_HASH[:12]}"
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -67,11 +90,57 @@ def _truncate(text: str) -> str:
     return text[:head] + "\n\n[…text truncated…]\n\n" + text[-tail:]
 
 
+def _get_model() -> "genai.GenerativeModel":
+    """Configure the SDK and build the model on first use, then reuse it.
+
+    The SDK (gRPC, protobuf) is imported here so CLI paths that never call
+    Gemini don't pay its import cost.
+    """
+    global _MODEL
+    if _MODEL is None:
+        with _MODEL_LOCK:
+            if _MODEL is None:
+                import google.generativeai as genai
+
+                genai.configure(api_key=GEMINI_API_KEY)
+                _MODEL = genai.GenerativeModel(GEMINI_MODEL)
+    return _MODEL
+
+
+def _reserve_slot() -> float:
+    """Claim the next Gemini call slot and return how many seconds to wait for it.
+
+    Slots are GEMINI_MIN_INTERVAL apart.  The lock is only held for the
+    bookkeeping, so both threads and coroutines can sleep outside it.
+    """
+    global _last_call
+    with _rate_lock:
+        now = time.monotonic()
+        slot = max(now, _last_call + GEMINI_MIN_INTERVAL)
+        _last_call = slot
+        return slot - now
+
+
+def _read_response(response) -> dict:
+    """Parse and normalise a Gemini response, failing fast on empty output."""
+    if not response.text:
+        raise RuntimeError("Gemini returned an empty response")
+
+    result = _normalise(_parse_response(response.text))
+    logger.info("Analysis OK — title=%r", result.get("title"))
+    return result
+
+
+def _retry_delay(attempt: int) -> float:
+    return REQUEST_RETRY_DELAY * (2 ** (attempt - 1))
+
+
 def _parse_response(raw: str) -> dict:
     """Strip any markdown fences and parse the JSON body."""
     cleaned = raw.strip()
-    cleaned = re.sub(r"^```(?:json)?\s*\n?", "", cleaned)
-    cleaned = re.sub(r"\n?```\s*$", "", cleaned)
+    if cleaned.startswith("```"):
+        cleaned = cleaned[3:].removeprefix("json")
+    cleaned = cleaned.removesuffix("```").strip()
     try:
         return json.loads(cleaned)
     except json.JSONDecodeError as exc:
@@ -81,23 +150,32 @@ def _parse_response(raw: str) -> dict:
         ) from exc
 
 
+_DEFAULTS: dict = {
+    "title": None,
+    "authors": None,
+    "year": None,
+    "keywords": [],
+    "main_topics": [],
+    "key_findings": "",
+    "methodology": "",
+    "relevance_score": "Medium",
+    "research_area": "Background",
+    "language": "English",
+}
+
+
 def _normalise(data: dict) -> dict:
     """Ensure all expected keys exist and lists are actually lists."""
-    data.setdefault("title", None)
-    data.setdefault("authors", None)
-    data.setdefault("year", None)
-    data.setdefault("keywords", [])
-    data.setdefault("main_topics", [])
-    data.setdefault("key_findings", "")
-    data.setdefault("methodology", "")
-    data.setdefault("relevance_score", "Medium")
-    data.setdefault("research_area", "Background")
-    data.setdefault("language", "English")
-
-    # Gemini sometimes returns comma-separated strings instead of lists
+    data = _DEFAULTS | data
+
+    # Gemini sometimes returns comma-separated strings instead of lists;
+    # list() also keeps the shared default lists out of the result
     for key in ("keywords", "main_topics"):
-        if isinstance(data[key], str):
-            data[key] = [item.strip() for item in data[key].split(",") if item.strip()]
+        value = data[key]
+        if type(value) is str:
+            data[key] = [item.strip() for item in value.split(",") if item.strip()]
+        else:
+            data[key] = list(value or ())
 
     return data
 
@@ -113,23 +191,51 @@ def analyze_paper(paper_text: str) -> dict:
     Raises:
         RuntimeError: If all retries are exhausted or JSON parsing fails.
     """
-    genai.configure(api_key=GEMINI_API_KEY)
-    model = genai.GenerativeModel(GEMINI_MODEL)
-
+    model = _get_model()
     prompt = _PROMPT_TEMPLATE.format(paper_text=_truncate(paper_text))
     last_error: Optional[Exception] = None
 
     for attempt in range(1, REQUEST_RETRY_COUNT + 1):
         try:
+            time.sleep(_reserve_slot())
             logger.info("Gemini call attempt %d (model=%s)", attempt, GEMINI_MODEL)
-            response = model.generate_content(prompt)
+            return _read_response(model.generate_content(prompt))
+
+        except RuntimeError:
+            raise  # parse errors / empty responses → fail fast
+        except Exception as exc:
+            last_error = exc
+            logger.warning("Attempt %d failed: %s", attempt, exc)
+            if attempt < REQUEST_RETRY_COUNT:
+                delay = _retry_delay(attempt)
+                logger.info("Retrying in %.1f s…", delay)
+                time.sleep(delay)
+
+    raise RuntimeError(
+        f"Gemini API failed after {REQUEST_RETRY_COUNT} attempts: {last_error}"
+    )
+
 
-            if not response.text:
-                raise RuntimeError("Gemini returned an empty response")
+async def analyze_paper_async(paper_text: str) -> dict:
+    """Coroutine version of ``analyze_paper`` for use inside an event loop.
 
-            result = _normalise(_parse_response(response.text))
-            logger.info("Analysis OK — title=%r", result.get("title"))
-            return result
+    Waits (rate limit, back-off, the request itself) without holding a thread,
+    so one loop can keep many papers in flight.  Use it from a single event
+    loop per process — the SDK's async channel is bound to the loop that
+    first uses it.
+
+    Raises:
+        RuntimeError: If all retries are exhausted or JSON parsing fails.
+    """
+    model = _get_model()
+    prompt = _PROMPT_TEMPLATE.format(paper_text=_truncate(paper_text))
+    last_error: Optional[Exception] = None
+
+    for attempt in range(1, REQUEST_RETRY_COUNT + 1):
+        try:
+            await asyncio.sleep(_reserve_slot())
+            logger.info("Gemini call attempt %d (model=%s)", attempt, GEMINI_MODEL)
+            return _read_response(await model.generate_content_async(prompt))
 
         except RuntimeError:
             raise  # parse errors / empty responses → fail fast
@@ -137,9 +243,9 @@ def analyze_paper(paper_text: str) -> dict:
             last_error = exc
             logger.warning("Attempt %d failed: %s", attempt, exc)
             if attempt < REQUEST_RETRY_COUNT:
-                delay = REQUEST_RETRY_DELAY * (2 ** (attempt - 1))
+                delay = _retry_delay(attempt)
                 logger.info("Retrying in %.1f s…", delay)
-                time.sleep(delay)
+                await asyncio.sleep(delay)
 
     raise RuntimeError(
         f"Gemini API failed after {REQUEST_RETRY_COUNT} attempts: {last_error}"
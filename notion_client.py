@@ -1,6 +1,9 @@
 """Notion API client — creates paper pages and checks for duplicates."""
 
+import functools
 import logging
+import re
+import threading
 from datetime import date
 from typing import Optional
 
@@ -12,10 +15,12 @@ logger = logging.getLogger(__name__)
 
 _API_VERSION = "2022-06-28"
 _BASE_URL = "https://api.notion.com/v1"
+_WS_RE = re.compile(r"\s+")
 
 
+@functools.lru_cache(maxsize=1)
 def _headers() -> dict[str, str]:
-    """Build auth headers at call time so the token is always current."""
+    """Auth and API-version headers, installed once as session defaults."""
     return {
         "Authorization": f"Bearer {NOTION_API_TOKEN}",
         "Content-Type": "application/json",
@@ -23,6 +28,52 @@ def _headers() -> dict[str, str]:
     }
 
 
+_SESSION_LOCK = threading.Lock()
+_SESSION: Optional[requests.Session] = None
+
+
+def _session() -> requests.Session:
+    """One pooled, auto-retrying session, built on first use and then shared.
+
+    Queries are retried on 429/5xx; page creation only on 429.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                session = requests.Session()
+                session.headers.update(_headers())
+                retry = Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 502, 503, 504],
+                    allowed_methods=["GET", "POST"],
+                )
+                session.mount(
+                    "https://",
+                    HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry),
+                )
+                # Creating a page is not idempotent: a 5xx or dropped response
+                # may come after Notion saved it, so only retry what can't
+                # have reached it (refused connections and 429 rate limits)
+                create_retry = Retry(
+                    total=3,
+                    read=0,
+                    backoff_factor=0.5,
+                    status_forcelist=[429],
+                    allowed_methods=["POST"],
+                )
+                session.mount(
+                    f"{_BASE_URL}/pages",
+                    HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=create_retry),
+                )
+                _SESSION = session
+    return _SESSION
+
+
 # ---------------------------------------------------------------------------
 # Property builders — one small helper per Notion property type
 # ---------------------------------------------------------------------------
@@ -65,15 +116,64 @@ def _prop_url(value: Optional[str]) -> dict:
 
 def _normalize_title(title: str) -> str:
     """Normalize a title for comparison by removing extra whitespace and newlines."""
-    import re
     # Replace newlines and multiple spaces with single space
-    normalized = re.sub(r'\s+', ' ', title)
-    return normalized.strip().lower()
+    return _WS_RE.sub(" ", title).strip().lower()
+
+
+def _page_title(page: dict) -> str:
+    """Return the plain Title text of a database row ("" when missing)."""
+    title_blocks = page.get("properties", {}).get("Title", {}).get("title", [])
+    return title_blocks[0]["text"]["content"] if title_blocks else ""
+
+
+def prefetch_existing_titles() -> Optional[dict[str, str]]:
+    """Map the normalized title of every page in the database to its URL.
+
+    Lets a batch check duplicates locally instead of querying Notion once per
+    paper.  Returns None if the database cannot be read, in which case callers
+    should fall back to ``check_duplicate``'s per-paper query.
+    """
+    titles: dict[str, str] = {}
+    payload: dict = {"page_size": 100}
+
+    logger.info("Prefetching existing titles from Notion")
+    try:
+        while True:
+            resp = _session().post(
+                f"{_BASE_URL}/databases/{NOTION_DATABASE_ID}/query",
+                json=payload,
+                timeout=15,
+            )
+            resp.raise_for_status()
+            data = resp.json()
+
+            for page in data.get("results", []):
+                page_title = _page_title(page)
+                if page_title:
+                    titles.setdefault(_normalize_title(page_title), page.get("url"))
+
+            if not data.get("has_more"):
+                break
+            payload["start_cursor"] = data["next_cursor"]
+
+    except Exception as exc:  # noqa: BLE001 — must never crash the pipeline
+        logger.warning("Title prefetch failed (checking per paper instead): %s", exc)
+        return None
+
+    logger.info("Prefetched %d existing titles", len(titles))
+    return titles
 
 
-def check_duplicate(title: str, url: Optional[str] = None) -> Optional[str]:
+def check_duplicate(
+    title: str,
+    url: Optional[str] = None,
+    cache: Optional[dict[str, str]] = None,
+) -> Optional[str]:
     """Query Notion for a page whose Title matches *title* (case-insensitive).
 
+    When *cache* (from ``prefetch_existing_titles``) is given, it is consulted
+    instead of querying Notion.
+
     Returns the existing page URL if found, else None.
     Failures are non-fatal — logged as a warning and the pipeline continues.
     """
@@ -83,26 +183,27 @@ def check_duplicate(title: str, url: Optional[str] = None) -> Optional[str]:
     logger.info("Checking duplicate for title: %r", title)
     normalized_title = _normalize_title(title)
 
+    if cache is not None:
+        return cache.get(normalized_title)
+
     try:
-        resp = requests.post(
+        # One near-exact query (Notion's "contains" ignores case), then compare
+        # normalized titles locally to absorb whitespace differences
+        resp = _session().post(
             f"{_BASE_URL}/databases/{NOTION_DATABASE_ID}/query",
-            headers=_headers(),
             json={
                 "filter": {
                     "property": "Title",
-                    "title": {"contains": title[:100]},
+                    "title": {"contains": _WS_RE.sub(" ", title).strip()[:100]},
                 },
-                "page_size": 10,  # Increased to catch more potential matches
+                "page_size": 100,
             },
             timeout=15,
         )
         resp.raise_for_status()
 
         for page in resp.json().get("results", []):
-            title_blocks = (
-                page.get("properties", {}).get("Title", {}).get("title", [])
-            )
-            page_title = title_blocks[0]["text"]["content"] if title_blocks else ""
+            page_title = _page_title(page)
             normalized_page_title = _normalize_title(page_title)
 
             if normalized_page_title == normalized_title:
@@ -165,9 +266,8 @@ def create_paper_page(
 
     logger.info("Creating Notion page: %s", title)
     try:
-        resp = requests.post(
+        resp = _session().post(
             f"{_BASE_URL}/pages",
-            headers=_headers(),
             json=payload,
             timeout=15,
         )
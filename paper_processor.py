@@ -1,17 +1,20 @@
 """paper_processor — main CLI entry point for processing academic papers."""
 
 import argparse
+import asyncio
+import contextlib
+import errno
+import itertools
 import logging
 import os
+import shutil
 import sys
-import time
-from typing import Optional
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
 import config
 from config import validate_config, LOG_FILE
-from pdf_extractor import ExtractedPaper, extract_text_from_pdf, download_pdf, resolve_doi_to_pdf
-from llm_analyzer import analyze_paper
-from notion_client import create_paper_page, check_duplicate
 
 
 # ---------------------------------------------------------------------------
@@ -100,47 +103,76 @@ def test_configuration() -> bool:
 # ---------------------------------------------------------------------------
 
 
-def process_single_paper(input_path: str, source: str, *, is_url: bool = False) -> bool:
+def _fill_from_pdf(analysis: dict, paper) -> None:
+    """Fall back to PDF-level metadata when Gemini misses fields."""
+    if not analysis.get("title") and paper.title:
+        analysis["title"] = paper.title
+    if not analysis.get("authors") and paper.authors:
+        analysis["authors"] = paper.authors
+
+
+def process_single_paper(
+    input_path: str,
+    source: str,
+    *,
+    is_url: bool = False,
+    dup_cache: Optional[dict[str, str]] = None,
+) -> bool:
     """Full pipeline for one paper: download? → extract → dedupe → analyse → create.
 
+    *dup_cache* is an optional title snapshot from ``prefetch_existing_titles``
+    used for the duplicate check instead of a per-paper Notion query.
+
     Returns True on success (including harmless skips like duplicates).
     """
+    # Imported here so --help / --test don't load PyMuPDF, Gemini and requests
+    from pdf_extractor import (
+        ExtractedPaper, extract_text_from_bytes, extract_text_from_pdf, download_pdf,
+    )
+    from llm_analyzer import ANALYSIS_CACHE_NAMESPACE, analyze_paper
+    from notion_client import create_paper_page, check_duplicate
+    import disk_cache
+
     pdf_path: Optional[str] = None
-    downloaded = False
+    data: Optional[bytes] = None
 
     try:
-        # --- obtain PDF ---
+        # --- obtain PDF and extract (downloads stay in memory) ---
         if is_url:
             print("  Downloading PDF…")
-            pdf_path = download_pdf(input_path)
-            downloaded = True
+            data = download_pdf(input_path)
+            print("  Extracting text…")
+            paper: ExtractedPaper = extract_text_from_bytes(data, input_path)
         else:
             pdf_path = os.path.abspath(input_path)
             if not os.path.isfile(pdf_path):
                 print(f"  ERROR — file not found: {pdf_path}")
                 return False
-
-        # --- extract ---
-        print("  Extracting text…")
-        paper: ExtractedPaper = extract_text_from_pdf(pdf_path)
+            print("  Extracting text…")
+            paper = extract_text_from_pdf(pdf_path)
         print(f"  → {len(paper.full_text):,} chars, {paper.num_pages} pages")
 
         # --- duplicate guard ---
         if paper.title:
-            dup_url = check_duplicate(paper.title)
+            dup_url = check_duplicate(paper.title, cache=dup_cache)
             if dup_url:
                 print(f"  SKIP — duplicate already in Notion: {dup_url}")
                 return True
 
-        # --- LLM analysis ---
-        print("  Analysing with Gemini…")
-        analysis = analyze_paper(paper.full_text)
+        # --- LLM analysis (cached by PDF content, so reruns skip Gemini) ---
+        if data is not None:
+            digest = disk_cache.data_digest(data)
+        else:
+            digest = disk_cache.file_digest(pdf_path)
+        analysis = disk_cache.load(ANALYSIS_CACHE_NAMESPACE, digest)
+        if analysis is not None:
+            print("  Using cached Gemini analysis")
+        else:
+            print("  Analysing with Gemini…")
+            analysis = analyze_paper(paper.full_text)
+            disk_cache.store(ANALYSIS_CACHE_NAMESPACE, digest, analysis)
 
-        # Fall back to PDF-level metadata when Gemini misses fields
-        if not analysis.get("title") and paper.title:
-            analysis["title"] = paper.title
-        if not analysis.get("authors") and paper.authors:
-            analysis["authors"] = paper.authors
+        _fill_from_pdf(analysis, paper)
 
         print(f"    Title   : {analysis.get('title', '—')}")
         print(f"    Authors : {analysis.get('authors', '—')}")
@@ -158,9 +190,85 @@ def process_single_paper(input_path: str, source: str, *, is_url: bool = False)
         print(f"  ERROR — {exc}")
         logger.error("Failed: %s", exc, exc_info=True)
         return False
+
+
+async def process_single_paper_async(
+    pdf_path: str,
+    source: str,
+    *,
+    dup_cache: Optional[dict[str, str]] = None,
+    in_flight: Optional[dict[str, asyncio.Event]] = None,
+) -> str:
+    """Event-loop version of ``process_single_paper`` for a local PDF.
+
+    Gemini is awaited natively; extraction, hashing and the Notion calls run
+    in worker threads.  Several papers are in flight at once, so step-by-step
+    progress goes to the debug log and the caller reports the outcome.
+
+    Pages created here are added to *dup_cache*.  *in_flight* maps normalized
+    titles being processed by other calls on the same loop to an event set
+    when they finish, so two copies of one paper are never both created.
+
+    Returns "success", "duplicate" or "failed".
+    """
+    from pdf_extractor import extract_text_from_pdf
+    from llm_analyzer import ANALYSIS_CACHE_NAMESPACE, analyze_paper_async
+    from notion_client import create_paper_page, check_duplicate, _normalize_title
+    import disk_cache
+
+    pdf_path = os.path.abspath(pdf_path)
+    name = os.path.basename(pdf_path)
+    if in_flight is None:
+        in_flight = {}
+    claimed: Optional[str] = None
+
+    try:
+        logger.debug("[%s] Extracting text", name)
+        paper = await asyncio.to_thread(extract_text_from_pdf, pdf_path)
+        logger.debug("[%s] %d chars, %d pages", name, len(paper.full_text), paper.num_pages)
+
+        if paper.title:
+            key = _normalize_title(paper.title)
+            while True:
+                # Wait out another copy of this paper, then see if it landed
+                while key in in_flight:
+                    await in_flight[key].wait()
+                if dup_cache is not None:
+                    # A local lookup: checking and claiming can't interleave
+                    dup_url = check_duplicate(paper.title, cache=dup_cache)
+                else:
+                    dup_url = await asyncio.to_thread(check_duplicate, paper.title)
+                if dup_url:
+                    logger.info("[%s] Duplicate already in Notion: %s", name, dup_url)
+                    return "duplicate"
+                if key not in in_flight:
+                    break
+            claimed = key
+            in_flight[key] = asyncio.Event()
+
+        digest = await asyncio.to_thread(disk_cache.file_digest, pdf_path)
+        analysis = disk_cache.load(ANALYSIS_CACHE_NAMESPACE, digest)
+        if analysis is not None:
+            logger.debug("[%s] Using cached Gemini analysis", name)
+        else:
+            logger.debug("[%s] Analysing with Gemini", name)
+            analysis = await analyze_paper_async(paper.full_text)
+            disk_cache.store(ANALYSIS_CACHE_NAMESPACE, digest, analysis)
+
+        _fill_from_pdf(analysis, paper)
+
+        page_url = await asyncio.to_thread(create_paper_page, analysis, source, pdf_url=pdf_path)
+        logger.debug("[%s] Created %s", name, page_url)
+        if claimed and dup_cache is not None:
+            dup_cache[claimed] = page_url
+        return "success"
+
+    except (FileNotFoundError, RuntimeError) as exc:
+        logger.error("[%s] Failed: %s", name, exc, exc_info=True)
+        return "failed"
     finally:
-        if downloaded and pdf_path and os.path.exists(pdf_path):
-            os.unlink(pdf_path)
+        if claimed:
+            in_flight.pop(claimed).set()
 
 
 # ---------------------------------------------------------------------------
@@ -168,44 +276,171 @@ def process_single_paper(input_path: str, source: str, *, is_url: bool = False)
 # ---------------------------------------------------------------------------
 
 
-def process_folder(folder_path: str, source: str, recursive: bool = False) -> dict[str, int]:
-    """Process every PDF in *folder_path* sequentially.
+def _walk_pdfs(folder: Path, recursive: bool = False) -> Iterator[Path]:
+    """Yield the PDFs in *folder* lazily, one directory listing at a time.
+
+    Entries are sorted per directory and ``processed/`` sub-directories are
+    skipped, so work can start before a large tree has been fully walked.
+    Directories that cannot be read are logged and skipped.
+    """
+    try:
+        with os.scandir(folder) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError as exc:
+        # Like Path.rglob: an unreadable or vanished directory is skipped,
+        # not allowed to end the whole walk
+        logger.warning("Skipping %s: %s", folder, exc)
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if recursive and entry.name != "processed":
+                yield from _walk_pdfs(Path(entry.path), recursive)
+        elif entry.is_file() and entry.name.lower().endswith(".pdf"):
+            yield Path(entry.path)
+
+
+def _move_pdf(src: Path, dest: Path) -> None:
+    """Move *src* to *dest* — a single rename unless they are on different filesystems."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.replace(src, dest)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dest))
+
+
+@contextlib.contextmanager
+def _log_above_progress_bar() -> Iterator[None]:
+    """Route console logging through tqdm, keeping the console's level.
+
+    ``logging_redirect_tqdm`` swaps the console handler for one left at
+    NOTSET, which would put every DEBUG record meant for the log file on
+    screen for the length of the batch.
+    """
+    from tqdm.contrib.logging import logging_redirect_tqdm
+
+    root = logging.getLogger()
+    before = list(root.handlers)
+    console_levels = [
+        h.level for h in before
+        if isinstance(h, logging.StreamHandler) and h.stream in (sys.stdout, sys.stderr)
+    ]
+    with logging_redirect_tqdm():
+        for handler in root.handlers:
+            if handler not in before:
+                # No console handler before: match logging's last-resort level
+                handler.setLevel(min(console_levels, default=logging.WARNING))
+        yield
+
+
+def _run_batch(
+    pdfs: Iterable[Path],
+    source: str,
+    *,
+    move_to: Optional[Path] = None,
+    workers: int = 4,
+    root: Optional[Path] = None,
+) -> Counter:
+    """Process *pdfs* with up to *workers* papers in flight on one event loop.
+
+    Args:
+        pdfs: PDFs to process; consumed lazily, so a generator is fine.
+        source: Source label for papers.
+        move_to: If set, successes and duplicates are moved here.
+        workers: Number of papers processed concurrently.
+        root: Folder the PDFs were found in.  Paths are shown (and mirrored
+            under *move_to*) relative to it; otherwise only names are used.
+
+    Returns a Counter of "success" / "duplicate" / "failed" outcomes.
+    """
+    from tqdm import tqdm
+    from notion_client import prefetch_existing_titles
+
+    counts: Counter = Counter()
+    remaining = iter(pdfs)
+    head = list(itertools.islice(remaining, 2))
+    if not head:
+        return counts
+    # Snapshotting the database costs a request per 100 rows — only worth it
+    # when there is more than one paper to check against it
+    dup_cache = prefetch_existing_titles() if len(head) > 1 else None
+    in_flight: dict[str, asyncio.Event] = {}  # titles being processed right now
+
+    def finish(pdf: Path, status: str, bar: tqdm) -> None:
+        rel_path = pdf.relative_to(root) if root else Path(pdf.name)
+        line = f"{rel_path} → {status}"
+        if status != "failed" and move_to is not None:
+            try:
+                _move_pdf(pdf, move_to / rel_path)
+                line += f", moved to {move_to.name}/{rel_path}"
+            except OSError as exc:
+                logger.error("Could not move %s: %s", rel_path, exc)
+                status = "failed"
+                line = f"{rel_path} → failed (page created, move failed)"
+        counts[status] += 1
+        bar.write(line)
+        bar.set_postfix(counts, refresh=False)
+        bar.update()
+
+    async def worker(it: Iterator[Path], bar: tqdm) -> None:
+        # Workers share one iterator, so each pulls the next PDF as it frees up
+        for pdf in it:
+            try:
+                status = await process_single_paper_async(
+                    str(pdf), source, dup_cache=dup_cache, in_flight=in_flight
+                )
+            except Exception:
+                # One bad PDF must not stop the other workers mid-batch
+                logger.exception("Unexpected error processing %s", pdf)
+                status = "failed"
+            finish(pdf, status, bar)
+
+    async def run() -> None:
+        it = itertools.chain(head, remaining)
+        # Total is unknown while discovery is streamed, so the bar counts up
+        with _log_above_progress_bar(), tqdm(unit="pdf") as bar:
+            await asyncio.gather(*(worker(it, bar) for _ in range(workers)))
+
+    # llm_analyzer spaces out the Gemini calls themselves
+    asyncio.run(run())
+
+    if counts:
+        print(
+            f"\nDone — {counts['success']} ok, {counts['duplicate']} duplicate(s), "
+            f"{counts['failed']} failed"
+        )
+    return counts
+
+
+def process_folder(
+    folder_path: str,
+    source: str,
+    recursive: bool = False,
+    workers: int = 4,
+) -> dict[str, int]:
+    """Process every PDF in *folder_path*, leaving the files in place.
 
     Args:
         folder_path: Directory to search for PDFs.
         source: Source label for papers.
         recursive: If True, search subdirectories recursively.
+        workers: Number of papers processed concurrently.
 
-    Returns {"success": N, "failed": N}.
+    Returns counts keyed by "success", "duplicate" and "failed".
     """
-    from pathlib import Path
-
     folder = Path(folder_path)
     if not folder.is_dir():
         print(f"ERROR — not a directory: {folder_path}")
         return {"success": 0, "failed": 0}
 
-    # Use rglob for recursive search, glob for non-recursive
-    pdfs = sorted(folder.rglob("*.pdf") if recursive else folder.glob("*.pdf"))
-    if not pdfs:
-        search_type = "recursively" if recursive else ""
-        print(f"No PDFs found in {folder_path} {search_type}".strip())
-        return {"success": 0, "failed": 0}
-
-    counts = {"success": 0, "failed": 0}
     search_desc = "(including subdirectories)" if recursive else ""
-    print(f"\nBatch: {len(pdfs)} PDF(s) in {folder_path} {search_desc}\n".strip())
+    print(f"\nBatch: PDFs in {folder_path} {search_desc}\n".strip())
 
-    for i, pdf in enumerate(pdfs, 1):
-        print(f"\n[{i}/{len(pdfs)}] {pdf.name}")
-        if process_single_paper(str(pdf), source):
-            counts["success"] += 1
-        else:
-            counts["failed"] += 1
-        if i < len(pdfs):
-            time.sleep(2)  # respect Gemini rate limits
-
-    print(f"\nBatch done — {counts['success']} ok, {counts['failed']} failed")
+    counts = _run_batch(_walk_pdfs(folder, recursive), source, workers=workers, root=folder)
+    if not counts:
+        search_type = "recursively" if recursive else ""
+        print(f"No PDFs found in {folder_path} {search_type}".strip())
     return counts
 
 
@@ -245,6 +480,10 @@ def _build_parser() -> argparse.ArgumentParser:
         "-r", "--recursive", action="store_true",
         help="When used with --folder, search subdirectories recursively.",
     )
+    parser.add_argument(
+        "--workers", type=int, default=4,
+        help="When used with --folder, papers processed in parallel (default: 4).",
+    )
     return parser
 
 
@@ -272,6 +511,8 @@ def main() -> None:
         sys.exit(0 if process_single_paper(args.url, args.source, is_url=True) else 1)
     elif args.doi:
         # Resolve DOI to PDF URL, then process it
+        from pdf_extractor import resolve_doi_to_pdf
+
         try:
             print(f"Resolving DOI: {args.doi}")
             pdf_url = resolve_doi_to_pdf(args.doi)
@@ -280,7 +521,7 @@ def main() -> None:
             print(f"ERROR — {e}")
             sys.exit(1)
     elif args.folder:
-        result = process_folder(args.folder, args.source, recursive=args.recursive)
+        result = process_folder(args.folder, args.source, recursive=args.recursive, workers=args.workers)
         sys.exit(0 if result["failed"] == 0 else 1)
 
 
@@ -1,20 +1,62 @@
 """PDF text extraction using PyMuPDF (fitz)."""
 
+import functools
+import hashlib
+import io
 import logging
+import multiprocessing
 import os
 import re
-import tempfile
+import stat
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional
+from html.parser import HTMLParser
+from typing import Iterable, Iterator, Optional
+from urllib.parse import urljoin, urlsplit
 
 import fitz  # PyMuPDF
 import requests
 
-from config import REQUEST_RETRY_COUNT, REQUEST_RETRY_DELAY
+import disk_cache
+from config import MAX_PDF_BYTES, REQUEST_RETRY_COUNT, REQUEST_RETRY_DELAY
 
 logger = logging.getLogger(__name__)
 
+# Long documents are split into page ranges extracted in worker processes
+_PARALLEL_MIN_PAGES = 100
+_PAGES_PER_TASK = 25
+
+# MuPDF's defaults for "text", minus ligature preservation (so ﬁ/ﬂ come out
+# as plain letters) plus joining words hyphenated across line breaks
+_TEXT_FLAGS = (fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES) | fitz.TEXT_DEHYPHENATE
+
+# MuPDF is not thread-safe: every in-process fitz call runs under this lock.
+# get_text() holds the GIL anyway, so serialising costs no parallelism —
+# real parallelism comes from the worker processes below.
+_MUPDF_LOCK = threading.Lock()
+
+_PAGE_POOL_LOCK = threading.Lock()
+_PAGE_POOL: Optional[ProcessPoolExecutor] = None
+
+_SESSION_LOCK = threading.Lock()
+_SESSION: Optional[requests.Session] = None
+
+# Read size for streamed downloads — big enough that the Python loop is
+# negligible next to the network
+_DOWNLOAD_CHUNK = 256 * 1024
+
+# How long a resolved DOI stays cached; failures are retried sooner
+_DOI_CACHE_TTL = 90 * 24 * 3600
+_DOI_MISS_TTL = 24 * 3600
+
+# Concurrent DOI lookups allowed against any one host (Unpaywall, doi.org,
+# a publisher), however many resolve_dois_to_pdfs workers are running
+_PER_HOST_LIMIT = 4
+_HOST_SLOTS_LOCK = threading.Lock()
+_HOST_SLOTS: dict[str, threading.BoundedSemaphore] = {}
+
 
 # ---------------------------------------------------------------------------
 # Data model
@@ -23,19 +65,33 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class ExtractedPaper:
-    """All text and metadata pulled from a single PDF."""
+    """All text and metadata pulled from a single PDF.
+
+    ``title`` and ``abstract`` are detected from the text on first access.
+    """
 
-    title: Optional[str] = None
     authors: Optional[str] = None
-    abstract: Optional[str] = None
     body_text: str = ""
     num_pages: int = 0
     source_path: str = ""
     metadata: dict = field(default_factory=dict)
+    # Cleaned text of the first two non-empty pages, where abstracts live
+    head_text: str = field(default="", repr=False)
+
+    @functools.cached_property
+    def title(self) -> Optional[str]:
+        return _detect_title(self.body_text, self.metadata.get("title"))
 
-    @property
+    @functools.cached_property
+    def abstract(self) -> Optional[str]:
+        return _detect_abstract(self.head_text or self.body_text)
+
+    @functools.cached_property
     def full_text(self) -> str:
-        """Concatenate metadata hints + abstract + body into one string."""
+        """Concatenate metadata hints + abstract + body into one string.
+
+        Built once on first access; the body can run to megabytes.
+        """
         parts: list[str] = []
         if self.title:
             parts.append(f"Title: {self.title}")
@@ -53,13 +109,59 @@ class ExtractedPaper:
 # ---------------------------------------------------------------------------
 
 
-def download_pdf(url: str) -> str:
-    """Download a PDF to a temp file and return its path.
+def _session() -> requests.Session:
+    """One keep-alive session with automatic retries, shared by all downloads."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                session = requests.Session()
+                session.headers["User-Agent"] = (
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+                )
+                retry = Retry(
+                    total=REQUEST_RETRY_COUNT,
+                    backoff_factor=REQUEST_RETRY_DELAY,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                )
+                adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _SESSION = session
+    return _SESSION
+
+
+def _too_large_msg(url: str) -> str:
+    return (
+        f"Download aborted — larger than {MAX_PDF_BYTES // (1024 * 1024)} MB: {url}\n"
+        "  → Raise MAX_PDF_BYTES in config.py if this is expected"
+    )
+
+
+def _require_pdf_magic(head: bytes, url: str, content_type: str) -> None:
+    """Raise unless the %PDF- header appears in the first KB of *head*."""
+    if b"%PDF-" not in head[:1024]:
+        raise RuntimeError(
+            f"Not a PDF ({content_type or 'no Content-Type'}): {url}\n"
+            "  → This is likely a paywall or landing page, not the paper itself\n"
+            "  → Try --doi if you have the paper's DOI\n"
+            "  → Or download manually and use --pdf"
+        )
+
+
+def download_pdf(url: str) -> bytes:
+    """Download a PDF into memory and return its bytes.
+
+    Pass the result to ``extract_text_from_bytes``; nothing touches the disk.
 
     Automatically converts arXiv /abs/ URLs to /pdf/ export URLs.
 
     Raises:
-        RuntimeError: After all retries are exhausted.
+        RuntimeError: If the download fails (transient errors are retried),
+            is not a PDF, or is larger than MAX_PDF_BYTES.
     """
     # Normalise arXiv abstract links → PDF export links
     if "arxiv.org/abs/" in url:
@@ -77,34 +179,37 @@ def download_pdf(url: str) -> str:
         logger.info("Converted ScienceDirect URL → %s", url)
         logger.warning("ScienceDirect PDFs often require subscription access")
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-        "Accept": "application/pdf,*/*",
-    }
-    last_error: Optional[Exception] = None
-
-    for attempt in range(1, REQUEST_RETRY_COUNT + 1):
-        try:
-            logger.info("Downloading %s (attempt %d)", url, attempt)
-            resp = requests.get(url, headers=headers, timeout=30, stream=True)
+    try:
+        logger.info("Downloading %s", url)
+        with _session().get(
+            url, headers={"Accept": "application/pdf,*/*"}, timeout=30, stream=True
+        ) as resp:
             resp.raise_for_status()
+            if int(resp.headers.get("Content-Length") or 0) > MAX_PDF_BYTES:
+                raise RuntimeError(_too_large_msg(url))
 
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-            for chunk in resp.iter_content(chunk_size=8192):
-                tmp.write(chunk)
-            tmp.close()
+            # Servers that don't label the body as a PDF usually sent an HTML
+            # landing page; sniff the first KB before downloading the rest.
+            content_type = resp.headers.get("Content-Type", "").lower()
+            buf = io.BytesIO()
+            if "pdf" not in content_type and "octet-stream" not in content_type:
+                buf.write(resp.raw.read(1024, decode_content=True))
+                _require_pdf_magic(buf.getvalue(), url, content_type)
 
-            logger.info("Saved to %s", tmp.name)
-            return tmp.name
+            for chunk in resp.iter_content(chunk_size=_DOWNLOAD_CHUNK):
+                buf.write(chunk)
+                if buf.tell() > MAX_PDF_BYTES:
+                    raise RuntimeError(_too_large_msg(url))
 
-        except requests.RequestException as exc:
-            last_error = exc
-            logger.warning("Download attempt %d failed: %s", attempt, exc)
-            if attempt < REQUEST_RETRY_COUNT:
-                time.sleep(REQUEST_RETRY_DELAY)
+        logger.info("Downloaded %d bytes", buf.tell())
+        return buf.getvalue()
+
+    except requests.RequestException as exc:
+        last_error = exc
+        logger.warning("Download failed: %s", exc)
 
     # Provide helpful error message based on the error type
-    error_msg = f"Download failed after {REQUEST_RETRY_COUNT} attempts: {last_error}"
+    error_msg = f"Download failed: {last_error}"
 
     # Check for common publisher issues
     if "403" in str(last_error) or "Forbidden" in str(last_error):
@@ -130,34 +235,74 @@ def download_pdf(url: str) -> str:
     raise RuntimeError(error_msg)
 
 
-def resolve_doi_to_pdf(doi: str) -> str:
-    """Resolve a DOI to a PDF URL using multiple strategies.
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    """Semaphore capping concurrent lookups against *url*'s host."""
+    host = urlsplit(url).hostname or ""
+    with _HOST_SLOTS_LOCK:
+        if host not in _HOST_SLOTS:
+            _HOST_SLOTS[host] = threading.BoundedSemaphore(_PER_HOST_LIMIT)
+        return _HOST_SLOTS[host]
 
-    Accepts DOI in any format:
-        - 10.1234/example
-        - doi:10.1234/example
-        - https://doi.org/10.1234/example
 
-    Returns a direct PDF URL if found.
+def _looks_like_pdf(resp: requests.Response) -> bool:
+    """True if a (HEAD or GET) response points straight at a PDF."""
+    content_type = resp.headers.get("Content-Type", "").lower()
+    return "pdf" in content_type or resp.url.split("?")[0].lower().endswith(".pdf")
 
-    Raises:
-        RuntimeError: If no PDF URL could be found for the DOI.
+
+class _PdfLinkFinder(HTMLParser):
+    """Remembers the first href that looks like a link to a PDF."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.href: Optional[str] = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        if self.href is not None:
+            return
+        for name, value in attrs:
+            if name == "href" and value:
+                lowered = value.lower()
+                if ".pdf" in lowered or "pdf" in lowered.partition("download")[2]:
+                    self.href = value
+                return
+
+
+def _scan_for_pdf_link(resp: requests.Response) -> Optional[str]:
+    """Stream a landing page through the HTML parser until a PDF link turns up.
+
+    Relative links are resolved against the page URL.  The rest of the page
+    is never downloaded once a link is found.
     """
-    # Normalize DOI to just the identifier
-    doi_clean = doi.strip()
-    if doi_clean.startswith("https://doi.org/"):
-        doi_clean = doi_clean.replace("https://doi.org/", "")
-    elif doi_clean.startswith("http://doi.org/"):
-        doi_clean = doi_clean.replace("http://doi.org/", "")
-    elif doi_clean.startswith("doi:"):
-        doi_clean = doi_clean.replace("doi:", "")
+    if resp.encoding is None:
+        resp.encoding = "utf-8"
+    finder = _PdfLinkFinder()
+    for chunk in resp.iter_content(chunk_size=16 * 1024, decode_unicode=True):
+        finder.feed(chunk)
+        if finder.href:
+            return urljoin(resp.url, finder.href)
+    return None
 
-    logger.info("Resolving DOI: %s", doi_clean)
 
+def _is_transient(resp: requests.Response) -> bool:
+    """True for answers that say "try later" rather than anything about the DOI."""
+    return resp.status_code == 429 or resp.status_code >= 500
+
+
+def _find_pdf_url(doi_clean: str) -> tuple[Optional[str], bool]:
+    """Try each resolution strategy in turn.
+
+    Returns ``(pdf_url, complete)``: *pdf_url* is None if no strategy found a
+    PDF, and *complete* is False if any lookup failed (network error, 429 or
+    5xx), in which case a miss says nothing about the DOI itself.
+    """
+    complete = True
     # Strategy 1: Try Unpaywall API (free, legal, finds open access PDFs)
     try:
         unpaywall_url = f"https://api.unpaywall.org/v2/{doi_clean}?email=paper-processor@example.com"
-        resp = requests.get(unpaywall_url, timeout=10)
+        with _host_slot(unpaywall_url):
+            resp = _session().get(unpaywall_url, timeout=10)
+        complete = complete and not _is_transient(resp)
         if resp.status_code == 200:
             data = resp.json()
             # Check for best open access location
@@ -165,8 +310,9 @@ def resolve_doi_to_pdf(doi: str) -> str:
             if best_oa and best_oa.get("url_for_pdf"):
                 pdf_url = best_oa["url_for_pdf"]
                 logger.info("Found PDF via Unpaywall: %s", pdf_url)
-                return pdf_url
+                return pdf_url, True
     except Exception as exc:
+        complete = False
         logger.debug("Unpaywall lookup failed: %s", exc)
 
     # Strategy 2: Try common publisher patterns
@@ -183,43 +329,48 @@ def resolve_doi_to_pdf(doi: str) -> str:
         if match:
             pdf_url = url_builder(match)
             logger.info("Constructed PDF URL from DOI pattern: %s", pdf_url)
-            return pdf_url
+            return pdf_url, True
 
     # Strategy 3: Follow DOI redirect and look for PDF link
     # This is a last resort and may not always work
     try:
         doi_url = f"https://doi.org/{doi_clean}"
-        resp = requests.get(doi_url, timeout=10, allow_redirects=True)
-        if resp.status_code == 200:
-            # Check if the response itself is a PDF
-            content_type = resp.headers.get("Content-Type", "")
-            if "pdf" in content_type.lower():
-                logger.info("DOI resolved directly to PDF")
-                # Download to temp file
-                tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-                tmp.write(resp.content)
-                tmp.close()
-                return tmp.name
-
-            # Try to find PDF link in the HTML
-            text = resp.text.lower()
-            # Look for common PDF link patterns
-            pdf_patterns = [
-                r'href=["\']([^"\']*\.pdf[^"\']*)["\']',
-                r'href=["\']([^"\']*download[^"\']*pdf[^"\']*)["\']',
-            ]
-            for pattern in pdf_patterns:
-                matches = re.findall(pattern, resp.text)
-                if matches:
-                    pdf_link = matches[0]
-                    # Make absolute URL if needed
-                    if pdf_link.startswith("http"):
+        # A HEAD is enough to learn where the DOI points.  Paywalled
+        # publishers often answer 402/403, but the final URL is still valid.
+        with _host_slot(doi_url):
+            resp = _session().head(doi_url, timeout=10, allow_redirects=True)
+        complete = complete and not _is_transient(resp)
+        if resp.status_code in (200, 402, 403) and _looks_like_pdf(resp):
+            logger.info("DOI resolved directly to PDF: %s", resp.url)
+            return resp.url, True
+
+        # Only download the landing page when we have to scrape it.  Some
+        # servers refuse HEAD, so start over from doi.org in that case.
+        if resp.status_code not in (402, 403):
+            page_url = resp.url if resp.ok else doi_url
+            with _host_slot(page_url), _session().get(
+                page_url, timeout=10, allow_redirects=True, stream=True
+            ) as resp:
+                complete = complete and not _is_transient(resp)
+                if resp.status_code == 200:
+                    if _looks_like_pdf(resp):
+                        logger.info("DOI resolved directly to PDF: %s", resp.url)
+                        return resp.url, True
+
+                    pdf_link = _scan_for_pdf_link(resp)
+                    if pdf_link:
                         logger.info("Found PDF link on landing page: %s", pdf_link)
-                        return pdf_link
+                        return pdf_link, True
     except Exception as exc:
+        complete = False
         logger.debug("DOI redirect lookup failed: %s", exc)
 
-    raise RuntimeError(
+    return None, complete
+
+
+def _unresolved_doi(doi_clean: str) -> RuntimeError:
+    """The error raised when no strategy finds a PDF for a DOI."""
+    return RuntimeError(
         f"Could not resolve DOI {doi_clean} to a PDF URL.\n"
         f"  → This may be a paywalled paper without open access.\n"
         f"  → Try downloading the PDF manually and using --pdf instead.\n"
@@ -227,28 +378,98 @@ def resolve_doi_to_pdf(doi: str) -> str:
     )
 
 
+def resolve_doi_to_pdf(doi: str) -> str:
+    """Resolve a DOI to a PDF URL using multiple strategies.
+
+    Accepts DOI in any format:
+        - 10.1234/example
+        - doi:10.1234/example
+        - https://doi.org/10.1234/example
+
+    Returns a direct PDF URL if found.  Results (including failures) are
+    cached on disk, so reruns over the same papers skip the network.
+
+    Raises:
+        RuntimeError: If no PDF URL could be found for the DOI.
+    """
+    # Normalize DOI to just the identifier
+    doi_clean = doi.strip()
+    for prefix in ("https://doi.org/", "http://doi.org/", "doi:"):
+        doi_clean = doi_clean.removeprefix(prefix)
+
+    cache_key = hashlib.sha256(doi_clean.lower().encode()).hexdigest()
+    cached = disk_cache.load("doi", cache_key)
+    if cached:
+        ttl = _DOI_CACHE_TTL if cached.get("pdf_url") else _DOI_MISS_TTL
+        if time.time() - cached.get("resolved_at", 0) < ttl:
+            if cached.get("pdf_url"):
+                logger.info("DOI %s → %s (cached)", doi_clean, cached["pdf_url"])
+                return cached["pdf_url"]
+            raise _unresolved_doi(doi_clean)
+
+    logger.info("Resolving DOI: %s", doi_clean)
+    pdf_url, complete = _find_pdf_url(doi_clean)
+    # A miss is only worth remembering if every lookup actually got an answer
+    if pdf_url is not None or complete:
+        disk_cache.store(
+            "doi", cache_key, {"doi": doi_clean, "pdf_url": pdf_url, "resolved_at": time.time()}
+        )
+    if pdf_url is None:
+        raise _unresolved_doi(doi_clean)
+    return pdf_url
+
+
+def resolve_dois_to_pdfs(dois: Iterable[str], max_workers: int = 8) -> dict[str, str]:
+    """Resolve many DOIs concurrently; maps each resolvable DOI to its PDF URL.
+
+    DOIs that cannot be resolved are logged and left out of the result.
+    """
+    def resolve(doi: str) -> Optional[str]:
+        try:
+            return resolve_doi_to_pdf(doi)
+        except RuntimeError as exc:
+            logger.warning("%s", str(exc).split("\n", 1)[0])
+            return None
+
+    unique = list(dict.fromkeys(dois))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        urls = pool.map(resolve, unique)
+        return {doi: url for doi, url in zip(unique, urls) if url}
+
+
 # ---------------------------------------------------------------------------
 # Extraction helpers
 # ---------------------------------------------------------------------------
 
+_LIGATURES = str.maketrans({"ﬁ": "fi", "ﬂ": "fl", "ﬀ": "ff", "ﬃ": "ffi", "ﬄ": "ffl"})
+_BLANKLINES_RE = re.compile(r"\n{3,}")
+_TRAIL_WS_RE = re.compile(r"[^\S\n]+(?=\n)")
+# Abstracts sit near the top, so only the head of the text is searched and
+# the capture is bounded to keep the lazy scan short
+_ABSTRACT_SEARCH_CHARS = 8192
+_ABSTRACT_RE = re.compile(
+    r"(?:^|\n)\s*(?:Abstract|ABSTRACT|Summary)\s*:?\s*\n?"
+    r"(.{0,5000}?)"
+    r"(?=\n\s*(?:Keywords|KEYWORDS|1\.\s|Introduction|INTRODUCTION)|\Z)",
+    re.DOTALL | re.IGNORECASE,
+)
+
 
 def _clean_text(text: str) -> str:
-    """Remove PDF artifacts: ligatures, excessive blank lines, trailing spaces."""
-    for src, dst in [("ﬁ", "fi"), ("ﬂ", "fl"), ("ﬀ", "ff"), ("ﬃ", "ffi"), ("ﬄ", "ffl")]:
-        text = text.replace(src, dst)
-    text = re.sub(r"\n{3,}", "\n\n", text)  # collapse blank lines
-    text = "\n".join(line.rstrip() for line in text.split("\n"))
+    """Remove PDF artifacts: ligatures, excessive blank lines, trailing spaces.
+
+    MuPDF already expands ligatures with _TEXT_FLAGS; the translation here is
+    a cheap safety net for any that slip through.
+    """
+    text = text.translate(_LIGATURES)
+    text = _BLANKLINES_RE.sub("\n\n", text)  # collapse blank lines
+    text = _TRAIL_WS_RE.sub("", text)  # trailing whitespace on each line
     return text.strip()
 
 
 def _detect_abstract(text: str) -> Optional[str]:
     """Heuristically locate the abstract section."""
-    pattern = (
-        r"(?i)(?:^|\n)\s*(?:Abstract|ABSTRACT|Summary)\s*:?\s*\n?"
-        r"(.*?)"
-        r"(?=\n\s*(?:Keywords|KEYWORDS|1\.\s|Introduction|INTRODUCTION)|\Z)"
-    )
-    match = re.search(pattern, text, re.DOTALL)
+    match = _ABSTRACT_RE.search(text, 0, _ABSTRACT_SEARCH_CHARS)
     if match:
         candidate = _clean_text(match.group(1))
         if len(candidate) > 50:
@@ -267,25 +488,88 @@ def _detect_title(text: str, pdf_meta_title: Optional[str]) -> Optional[str]:
     return None
 
 
+def _page_text(page: "fitz.Page") -> str:
+    """Plain text of one page.
+
+    The page is parsed into a TextPage explicitly so that anything else read
+    from it here later (blocks, spans, ...) can share the one parse instead
+    of MuPDF re-reading the content stream per get_text() call.
+    """
+    textpage = page.get_textpage(flags=_TEXT_FLAGS)
+    return page.get_text("text", textpage=textpage)
+
+
+def _page_pool() -> ProcessPoolExecutor:
+    """Worker processes for page extraction, started on first use and reused.
+
+    MuPDF is not thread-safe, so pages are spread over processes that each
+    open their own copy of the document.  "spawn" avoids forking a process
+    that may have other threads running.
+    """
+    global _PAGE_POOL
+    if _PAGE_POOL is None:
+        with _PAGE_POOL_LOCK:
+            if _PAGE_POOL is None:
+                _PAGE_POOL = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _PAGE_POOL
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> list[str]:
+    """Text of pages [start, stop) — runs in a worker process."""
+    with fitz.open(pdf_path) as doc:
+        if doc.is_encrypted:
+            doc.authenticate("")
+        return [_page_text(doc[i]) for i in range(start, stop)]
+
+
+def _extract_pages_parallel(pdf_path: str, num_pages: int) -> list[str]:
+    """Extract every page's text, _PAGES_PER_TASK pages per worker task."""
+    starts = range(0, num_pages, _PAGES_PER_TASK)
+    stops = [min(start + _PAGES_PER_TASK, num_pages) for start in starts]
+    chunks = _page_pool().map(_extract_page_range, [pdf_path] * len(stops), starts, stops)
+    return [text for chunk in chunks for text in chunk]
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
 
-def extract_text_from_pdf(pdf_path: str) -> ExtractedPaper:
-    """Read a local PDF and return structured text + metadata.
+def _open_pdf(pdf_path: str, data: Optional[bytes] = None) -> "fitz.Document":
+    """Open a PDF, unlocking it if it only has an empty password.
+
+    Reads *pdf_path* from disk, or parses *data* in memory when given (in
+    which case *pdf_path* only names the document in messages).
 
     Raises:
         FileNotFoundError: Path does not exist.
-        RuntimeError: PDF is encrypted, unreadable, or appears to be scanned.
+        RuntimeError: PDF is empty, password-protected or unreadable.
     """
-    pdf_path = os.path.abspath(pdf_path)
-    if not os.path.isfile(pdf_path):
-        raise FileNotFoundError(f"PDF not found: {pdf_path}")
+    if data is None:
+        # One stat answers "exists?", "regular file?" and "empty?"
+        try:
+            st = os.stat(pdf_path)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
+            raise FileNotFoundError(f"PDF not found: {pdf_path}")
+        size = st.st_size
+    else:
+        size = len(data)
+    if not size:
+        raise RuntimeError(f"PDF is empty (0 bytes): {pdf_path}")
 
     logger.info("Opening %s", pdf_path)
     try:
-        doc = fitz.open(pdf_path)
+        if data is not None:
+            doc = fitz.open(stream=data, filetype="pdf")
+        else:
+            # Opening by path lets MuPDF read the file directly in C; handing
+            # it bytes (or an mmap) would only add a Python-side copy.
+            doc = fitz.open(pdf_path)
     except Exception as exc:
         raise RuntimeError(f"Cannot open PDF: {exc}") from exc
 
@@ -296,37 +580,110 @@ def extract_text_from_pdf(pdf_path: str) -> ExtractedPaper:
                 f"PDF is password-protected: {pdf_path}\n"
                 "  → Unlock it before processing."
             )
+    return doc
 
+
+def iter_page_text(pdf_path: str) -> Iterator[tuple[int, str]]:
+    """Yield ``(page_number, text)`` for each page, starting at 1.
+
+    Lets callers work through very large PDFs page by page without ever
+    holding the whole text in memory.
+
+    Raises:
+        FileNotFoundError: Path does not exist.
+        RuntimeError: PDF is password-protected or unreadable.
+    """
+    # The lock is taken per page, never held across a yield
+    with _MUPDF_LOCK:
+        doc = _open_pdf(os.path.abspath(pdf_path))
+    try:
+        for i in range(len(doc)):
+            with _MUPDF_LOCK:
+                text = _page_text(doc[i])
+            yield i + 1, text
+    finally:
+        with _MUPDF_LOCK:
+            doc.close()
+
+
+def extract_text_from_pdf(pdf_path: str) -> ExtractedPaper:
+    """Read a local PDF and return structured text + metadata.
+
+    Raises:
+        FileNotFoundError: Path does not exist.
+        RuntimeError: PDF is encrypted, unreadable, or appears to be scanned.
+    """
+    pdf_path = os.path.abspath(pdf_path)
+    with _MUPDF_LOCK:
+        return _extract(_open_pdf(pdf_path), pdf_path, parallel=True)
+
+
+def extract_text_from_bytes(data: bytes, source: str) -> ExtractedPaper:
+    """Like ``extract_text_from_pdf`` for a PDF already in memory.
+
+    *source* (typically the download URL) becomes ``source_path``.
+
+    Raises:
+        RuntimeError: PDF is encrypted, unreadable, or appears to be scanned.
+    """
+    with _MUPDF_LOCK:
+        return _extract(_open_pdf(source, data), source, parallel=False)
+
+
+def _scanned_pdf_error(finding: str) -> RuntimeError:
+    """The error raised for image-only PDFs, prefixed with what gave it away."""
+    return RuntimeError(
+        f"{finding} — this PDF is likely scanned and needs OCR.\n"
+        "  → Try uploading to Google Docs or an online OCR tool first."
+    )
+
+
+def _extract(doc: "fitz.Document", source: str, *, parallel: bool) -> ExtractedPaper:
+    """Pull text and metadata out of *doc*, then close it.
+
+    *parallel* allows handing long documents to worker processes, which
+    reopen the file by path.
+    """
     num_pages = len(doc)
     meta = doc.metadata or {}
 
-    # Pull text from every page
-    page_texts: list[str] = []
-    for page in doc:
-        t = page.get_text("text")
-        if t.strip():
-            page_texts.append(t)
-
-    doc.close()
+    # Pull text from every page into one growing buffer, keeping the first
+    # two non-empty pages aside for abstract detection
+    buf = io.StringIO()
+    head: list[str] = []
+    try:
+        # Text can't be drawn without a font, so a font-free document is an
+        # image-only scan; a cheap resource lookup spares the text pipeline.
+        if num_pages and not any(doc.get_page_fonts(i) for i in range(num_pages)):
+            raise _scanned_pdf_error(f"No fonts found in any of {num_pages} pages")
 
-    raw = "\n\n".join(page_texts)
+        if parallel and num_pages >= _PARALLEL_MIN_PAGES and (os.cpu_count() or 1) > 1:
+            texts = _extract_pages_parallel(source, num_pages)
+        else:
+            texts = (_page_text(page) for page in doc)
+        for t in texts:
+            if t.strip():
+                if len(head) < 2:
+                    head.append(t)
+                if buf.tell():
+                    buf.write("\n\n")
+                buf.write(t)
+    finally:
+        doc.close()
+
+    raw = buf.getvalue()
 
     # Guard against scanned / image-only PDFs
     if len(raw.strip()) < 100 and num_pages > 0:
-        raise RuntimeError(
-            f"Only {len(raw.strip())} characters extracted from {num_pages} pages — "
-            "this PDF is likely scanned and needs OCR.\n"
-            "  → Try uploading to Google Docs or an online OCR tool first."
+        raise _scanned_pdf_error(
+            f"Only {len(raw.strip())} characters extracted from {num_pages} pages"
         )
 
-    cleaned = _clean_text(raw)
-
     return ExtractedPaper(
-        title=_detect_title(cleaned, meta.get("title")),
         authors=meta.get("author"),
-        abstract=_detect_abstract(cleaned),
-        body_text=cleaned,
+        body_text=_clean_text(raw),
         num_pages=num_pages,
-        source_path=pdf_path,
+        source_path=source,
         metadata=meta,
+        head_text=_clean_text("\n\n".join(head)),
     )